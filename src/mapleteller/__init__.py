@@ -5,6 +5,13 @@ import logging
 from mapleteller.domain.services import PDFProcessor
 
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main():
     from tabulate import tabulate
 
@@ -13,7 +20,23 @@ def main():
 
     parser = argparse.ArgumentParser(description="Process bank statements")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
-    parser.add_argument("--file", help="Path to the statement file", required=True)
+    parser.add_argument(
+        "--file",
+        action="append",
+        help="Path to the statement file, repeat to process several",
+        required=True,
+    )
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="Number of processes used to extract page text or process files",
+    )
+    parser.add_argument(
+        "--plumber-layout",
+        action="store_true",
+        help="Lay out page text with pdfplumber instead of the built-in renderer",
+    )
 
     args = parser.parse_args()
 
@@ -22,7 +45,18 @@ def main():
     else:
         module_logger.setLevel(logging.INFO)
 
-    transactions = PDFProcessor.process(args.file, module_logger)
+    if len(args.file) == 1:
+        transactions = PDFProcessor.process(
+            args.file[0], module_logger, args.jobs, args.plumber_layout
+        )
+    else:
+        transactions = [
+            tx
+            for statement in PDFProcessor.process_batch(
+                args.file, module_logger, args.jobs, args.plumber_layout
+            )
+            for tx in statement
+        ]
     rows = []
     for tx in transactions:
         if tx.credit is not None:
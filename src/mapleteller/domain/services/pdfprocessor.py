@@ -1,13 +1,19 @@
 import io
+import itertools
 import logging
 import re
 import sys
+import unicodedata
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import date
-from typing import Self
+from typing import Literal, Self, cast
 
 import pdfplumber
 import pdfplumber.page
+from pdfminer.layout import LTChar, LTContainer
+from pdfplumber.utils.text import DEFAULT_X_DENSITY, LIGATURES
 
 from mapleteller.domain import Transaction
 
@@ -25,127 +31,506 @@ MONTHS = [
     "nov",
     "dec",
 ]
+# Statements spell months as "Jan" or "JAN".
+MONTH_INDEX = {
+    spelling: i + 1
+    for i, month in enumerate(MONTHS)
+    for spelling in (month.capitalize(), month.upper())
+}
+AMOUNT_DELETIONS = str.maketrans("", "", " ,.$")
+MULTISPACE_PATTERN = re.compile(r" {2,}")
+
+# pdfplumber defaults for layout=True, see render_layout.
+LAYOUT_Y_DENSITY = 13
+LAYOUT_Y_TOLERANCE = 3
 
 
 def sanitize_string(s: str) -> str:
-    while "  " in s:
-        s = s.replace("  ", " ")
-    return s
+    return MULTISPACE_PATTERN.sub(" ", s).strip()
+
+
+def collapse_whitespace(s: str) -> str:
+    return " ".join(s.split())
 
 
 def sanitize_amount(s: str) -> str:
-    return s.replace(" ", "").replace(",", "").replace(".", "").replace("$", "").strip()
+    return s.translate(AMOUNT_DELETIONS)
+
+
+def parse_cents(s: str) -> tuple[int | None, bool]:
+    """Parse an amount column into cents and whether it is marked CR."""
+    amount = sanitize_amount(s)
+    is_credit = amount.endswith("CR")
+    if is_credit:
+        amount = amount[:-2]
+    return (int(amount) if amount else None), is_credit
+
+
+def split_dates(
+    desc: str, count: int, month_suffix: str = ""
+) -> tuple[list[tuple[int, int]], str] | None:
+    """Split ``count`` leading "Mon DD" dates off an indented description.
+
+    Returns the (month, day) pairs and the rest of the description, or None
+    if the description does not start with that many dates.
+    """
+    if not desc[:1].isspace():
+        return None
+    tokens = desc.split(None, 2 * count)
+    if len(tokens) <= 2 * count:
+        return None
+
+    dates = []
+    for i in range(0, 2 * count, 2):
+        month, day = tokens[i], tokens[i + 1]
+        if month_suffix:
+            if not month.endswith(month_suffix):
+                return None
+            month = month[: -len(month_suffix)]
+        month_number = MONTH_INDEX.get(month)
+        if month_number is None or len(day) > 2 or not day.isdecimal():
+            return None
+        dates.append((month_number, int(day)))
+    return dates, tokens[-1]
+
+
+@dataclass(frozen=True, slots=True)
+class StatementFormat:
+    """Fixed-width columns of a BMO transaction table."""
+
+    desc_slice: slice
+    # Number of leading "Mon DD" dates: the transaction date, then the
+    # posting date if the statement has one.
+    date_count: int
+    month_suffix: str = ""
+    credit_slice: slice | None = None
+    debit_slice: slice | None = None
+    balance_slice: slice | None = None
+    # Single amount column where a CR suffix marks a payment.
+    amount_slice: slice | None = None
+    ref_slice: slice | None = None
+    # Whether a following line with only a description continues the note.
+    joins_next_line: bool = True
+    collapse_note: bool = False
+
+
+def cluster_tops(tops: list[float], tolerance: float) -> dict[float, int]:
+    """Number chains of tops that are at most ``tolerance`` apart."""
+    clusters = {}
+    index = -1
+    last = None
+    for top in sorted(set(tops)):
+        if last is None or top > last + tolerance:
+            index += 1
+        clusters[top] = index
+        last = top
+    return clusters
+
+
+def layout_chars(
+    page: pdfplumber.page.Page,
+) -> list[tuple[str, bool, float, float, float, float]]:
+    """(text, upright, x0, x1, top, bottom) of every character on the page.
+
+    Read from pdfminer's layout objects, in the same order and coordinates
+    as ``page.chars``, without building pdfplumber's dict for each of them.
+    """
+    mb_x0, mb_top = page.mediabox[:2]
+    height = page.height
+    # pdfplumber only accepts these forms, but types the attribute as str.
+    unicode_norm = cast(
+        Literal["NFC", "NFKC", "NFD", "NFKD"] | None, page.pdf.unicode_norm
+    )
+
+    def walk(objs):
+        for obj in objs:
+            if isinstance(obj, LTChar):
+                yield obj
+            elif isinstance(obj, LTContainer):
+                yield from walk(obj)
+
+    chars = []
+    for obj in walk(page.layout):
+        text = obj.get_text()
+        if unicode_norm is not None:
+            text = unicodedata.normalize(unicode_norm, text)
+        chars.append(
+            (
+                text,
+                obj.upright,
+                obj.x0 + mb_x0,
+                obj.x1 + mb_x0,
+                (height - obj.y1) + mb_top,
+                (height - obj.y0) + mb_top,
+            )
+        )
+    return chars
+
+
+def render_layout(
+    page: pdfplumber.page.Page,
+    x_density: float,
+    x_tolerance: float = 1,
+    bbox: tuple[float, float, float, float] | None = None,
+) -> str:
+    """Same text as ``page.extract_text(layout=True, ...)``.
+
+    With ``bbox``, same as extracting from ``page.within_bbox(bbox)``.
+
+    pdfplumber builds word and text maps of dicts for every character before
+    joining them; statements are upright text only, which is laid out here in
+    a single pass over pdfminer's characters. Anything else is left to
+    pdfplumber.
+    """
+    chars = layout_chars(page)
+    cropped = bbox is not None
+    if bbox is None:
+        bbox = page.bbox
+    else:
+        left, top, right, bottom = bbox
+        chars = [
+            char
+            for char in chars
+            if left <= char[2]
+            and char[3] <= right
+            and top <= char[4]
+            and char[5] <= bottom
+            and (char[3] - char[2]) + (char[5] - char[4]) > 0
+        ]
+    if not chars:
+        return ""
+    if not all(char[1] for char in chars):
+        if cropped:
+            page = page.within_bbox(bbox)
+        return page.extract_text(
+            layout=True, x_density=x_density, x_tolerance=x_tolerance
+        )
+
+    # Group characters into lines, then split each line into (top, x0, text)
+    # words at whitespace and horizontal gaps.
+    char_lines = cluster_tops([char[4] for char in chars], LAYOUT_Y_TOLERANCE)
+    chars = sorted(chars, key=lambda char: char_lines[char[4]])
+    words = []
+    for _, line in itertools.groupby(chars, key=lambda char: char_lines[char[4]]):
+        prev = None
+        for text, _, x0, x1, char_top, _ in sorted(line, key=lambda char: char[2]):
+            if text.isspace():
+                prev = None
+                continue
+            text = LIGATURES.get(text, text)
+            if (
+                prev is None
+                or x0 < prev[0]
+                or x0 > prev[1] + x_tolerance
+                or abs(char_top - prev[2]) > LAYOUT_Y_TOLERANCE
+            ):
+                words.append([char_top, x0, text])
+            else:
+                word = words[-1]
+                word[0] = min(word[0], char_top)
+                word[2] += text
+            prev = (x0, x1, char_top)
+
+    left, top, right, bottom = bbox
+    width_chars = round((right - left) / x_density)
+    height_chars = round((bottom - top) / LAYOUT_Y_DENSITY)
+    blank_line = " " * width_chars
+
+    out = []
+    num_newlines = 0
+    word_lines = cluster_tops([word[0] for word in words], LAYOUT_Y_TOLERANCE)
+    for i, (_, line) in enumerate(
+        itertools.groupby(words, key=lambda word: word_lines[word[0]])
+    ):
+        line = list(line)
+        newlines = max(
+            int(i > 0), round((line[0][0] - top) / LAYOUT_Y_DENSITY) - num_newlines
+        )
+        for _ in range(newlines):
+            if not out or out[-1] == "\n":
+                out.append(blank_line)
+            out.append("\n")
+        num_newlines += newlines
+
+        line_len = 0
+        for _, x0, text in line:
+            spaces = max(min(1, line_len), round((x0 - left) / x_density) - line_len)
+            out.append(" " * spaces + text)
+            line_len += spaces + len(text)
+        if line_len < width_chars:
+            out.append(" " * (width_chars - line_len))
+
+    for i in range(height_chars - (num_newlines + 1)):
+        if i > 0:
+            out.append(blank_line)
+        out.append("\n")
+
+    text = "".join(out)
+    return text.removesuffix("\n")
+
+
+# Page extraction state of a worker process, see PDFProcessor.process.
+_worker_source: str | bytes | None = None
+_worker_processor: "PDFProcessor | None" = None
+
+
+def _init_page_worker(source: str | bytes, processor: "PDFProcessor") -> None:
+    global _worker_source, _worker_processor
+    _worker_source = source
+    _worker_processor = processor
+
+
+def _extract_page_range(indexes: range) -> list[str]:
+    assert _worker_source is not None and _worker_processor is not None
+    # Open the document once per range and close it here: pool workers can
+    # exit without running atexit handlers.
+    source = _worker_source
+    with pdfplumber.open(
+        io.BytesIO(source) if isinstance(source, bytes) else source,
+        pages=[index + 1 for index in indexes],
+    ) as pdf:
+        return [_worker_processor.extract_text(page) for page in pdf.pages]
+
+
+def _init_batch_worker(logger_name: str, level: int) -> None:
+    # Spawned and forkserver workers start without the parent's logging setup.
+    logging.basicConfig()
+    logging.getLogger(logger_name).setLevel(level)
 
 
 class PDFProcessor(ABC):
     @staticmethod
-    def process(file: str, logger: logging.Logger) -> list[Transaction]:
+    def process(
+        file: str, logger: logging.Logger, jobs: int = 1, plumber_layout: bool = False
+    ) -> list[Transaction]:
         if file == "-":
             pdf_data = sys.stdin.buffer.read()
         if isinstance(file, bytes):
             pdf_data = file
             file = "-"
 
-        def file_or_stream():
-            return io.BytesIO(pdf_data) if file == "-" else file  # pyright: ignore[reportPossiblyUnboundVariable]
-
         logger.info("Processing file %s", file)
-        with pdfplumber.open(file_or_stream()) as pdf:
-            with pdfplumber.open(file_or_stream()) as pdf:
-                processor = None
-                for page in pdf.pages:
+        source = io.BytesIO(pdf_data) if file == "-" else file  # pyright: ignore[reportPossiblyUnboundVariable]
+        with pdfplumber.open(source) as pdf:
+            # Recognizing a statement only needs a few phrases, so any layout
+            # will do as long as words are single-spaced.
+            processor = None
+            first_page = ""
+            for page in pdf.pages:
+                if plumber_layout:
                     page_content = page.extract_text(layout=True, x_tolerance=1)
+                else:
+                    page_content = render_layout(page, DEFAULT_X_DENSITY)
+                page_content = collapse_whitespace(page_content)
+                if page.page_number == 1:
+                    first_page = page_content
+                processor = PDFProcessor._select_processor(
+                    page_content, logger, plumber_layout
+                )
+                if processor is not None:
+                    break
+
+            if processor is None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    print(first_page, file=sys.stderr)
+                raise ValueError("No idea what this is")
+
+            first_page_text = processor.extract_text(pdf.pages[0])
+            first_page = processor.extract_summary_text(pdf.pages[0], first_page_text)
+            try:
+                processor.process_first_page(first_page)
+            except Exception:
+                if logger.isEnabledFor(logging.DEBUG):
+                    print(first_page, file=sys.stderr)
+                raise
+
+            # Parsing carries state from one page to the next, so only the
+            # text extraction is spread over worker processes. pdfminer cannot
+            # share a document between threads, each worker opens its own.
+            # Each worker gets one contiguous range of the remaining pages.
+            executor = None
+            if jobs > 1 and len(pdf.pages) > 1:
+                indexes = range(1, len(pdf.pages))
+                workers = min(jobs, len(indexes))
+                size = -(-len(indexes) // workers)
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_page_worker,
+                    initargs=(pdf_data if file == "-" else file, processor),  # pyright: ignore[reportPossiblyUnboundVariable]
+                )
+                ranges = (
+                    indexes[start : start + size]
+                    for start in range(0, len(indexes), size)
+                )
+                texts = itertools.chain(
+                    [first_page_text],
+                    itertools.chain.from_iterable(
+                        executor.map(_extract_page_range, ranges)
+                    ),
+                )
+            else:
+                texts = itertools.chain(
+                    [first_page_text],
+                    (processor.extract_text(page) for page in pdf.pages[1:]),
+                )
 
-                    for processor_cls in [
-                        OldBMOMastercardPDFProcessor,
-                        BMOMastercardPDFProcessor,
-                        BMOChequingPDFProcessor,
-                        RBCChequingPDFProcessor,
-                        RBCMastercardPDFProcessor,
-                        RBCInvestPDFProcessor,
-                    ]:
-                        processor = processor_cls.try_create_processor(
-                            page_content, logger
-                        )
-                        if processor is not None:
-                            break
-                    if processor is not None:
+            transactions = []
+            try:
+                for page_number, text in enumerate(texts, start=1):
+                    logger.info("Processing page %d", page_number)
+                    transactions.extend(processor.process_page(text))
+                    # Pages after the end of the statement are not parsed.
+                    # Without workers they are not extracted either, with
+                    # workers only ranges not yet started are cancelled.
+                    if processor.doc_complete:
+                        if page_number < len(pdf.pages):
+                            logger.info(
+                                "Statement ended on page %d, skipping %d remaining pages",
+                                page_number,
+                                len(pdf.pages) - page_number,
+                            )
                         break
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
 
-                first_page = pdf.pages[0].extract_text(layout=True, x_tolerance=1)
+            return processor.post_process_transactions(transactions)
 
-                if processor is None:
-                    if logger.isEnabledFor(logging.DEBUG):
-                        print(first_page, file=sys.stderr)
-                    raise ValueError("No idea what this is")
+    @staticmethod
+    def process_batch(
+        files: list[str],
+        logger: logging.Logger,
+        jobs: int | None = None,
+        plumber_layout: bool = False,
+    ) -> list[list[Transaction]]:
+        """Process independent statement files, in parallel unless ``jobs=1``.
+
+        Returns the transactions of each file, in the order of ``files``.
+        With ``jobs=1`` the files are processed one after another in this
+        process. Otherwise workers read the files, so "-" (stdin) is not
+        supported.
+        """
+        if jobs == 1:
+            return [
+                PDFProcessor.process(file, logger, 1, plumber_layout) for file in files
+            ]
+        if "-" in files:
+            raise ValueError("Cannot read stdin from worker processes")
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_batch_worker,
+            initargs=(logger.name, logger.getEffectiveLevel()),
+        ) as executor:
+            return list(
+                executor.map(
+                    PDFProcessor.process,
+                    files,
+                    itertools.repeat(logger),
+                    itertools.repeat(1),
+                    itertools.repeat(plumber_layout),
+                )
+            )
 
-                try:
-                    processor.process_first_page(first_page)
-                except Exception:
-                    if logger.isEnabledFor(logging.DEBUG):
-                        print(first_page, file=sys.stderr)
-                    raise
-
-                transactions = []
-                with pdfplumber.open(file_or_stream()) as pdf:
-                    for page in pdf.pages:
-                        text = processor.extract_text(page)
-                        logger.info("Processing page %d", page.page_number)
-                        transactions.extend(processor.process_page(text))
-
-                return processor.post_process_transactions(transactions)
-
-    def __init__(self, logger: logging.Logger):
+    @staticmethod
+    def _select_processor(
+        page_content: str, logger: logging.Logger, plumber_layout: bool = False
+    ) -> "PDFProcessor | None":
+        for processor_cls in PROCESSORS:
+            processor = processor_cls.try_create_processor(
+                page_content, logger, plumber_layout
+            )
+            if processor is not None:
+                return processor
+        return None
+
+    # Phrases that all appear on the first page of the statements a processor
+    # reads.
+    MARKERS: tuple[str, ...] = ()
+
+    @classmethod
+    def try_create_processor(
+        cls, first_page: str, logger: logging.Logger, plumber_layout: bool = False
+    ) -> Self | None:
+        if cls.MARKERS and all(marker in first_page for marker in cls.MARKERS):
+            logger.debug("Looks like a statement for %s", cls.__name__)
+            return cls(logger, plumber_layout)
+        return None
+
+    def __init__(self, logger: logging.Logger, plumber_layout: bool = False):
         self.logger = logger
+        # Checked once; row parsers skip building debug output without it.
+        self.debug = logger.isEnabledFor(logging.DEBUG)
+        # Lay out pages with pdfplumber instead of render_layout.
+        self.plumber_layout = plumber_layout
+        self.doc_complete = False
+
+    def extract_layout_text(
+        self,
+        page: pdfplumber.page.Page,
+        x_density: float,
+        bbox: tuple[float, float, float, float] | None = None,
+    ) -> str:
+        if self.plumber_layout:
+            if bbox is not None:
+                page = page.within_bbox(bbox)
+            return page.extract_text(layout=True, x_density=x_density, x_tolerance=1)
+        return render_layout(page, x_density, bbox=bbox)
 
     def process_page(self, text: str) -> list[Transaction]:
-        lines = text.split("\n")
-        transactions = []
+        debug = self.debug
+        lines = iter(text.split("\n"))
 
-        began_transaction = False
-        for i in range(len(lines)):
-            self.logger.debug("[?] %s", lines[i])
-            if self.should_begin_processing_transaction(lines[i]):
-                lines = lines[i + 1 :]
-                began_transaction = True
+        for line in lines:
+            if debug:
+                self.logger.debug("[?] %s", line)
+            if self.should_begin_processing_transaction(line):
                 break
-
-        if not began_transaction:
+        else:
             self.logger.warning("No transaction found on current page")
             return []
 
-        for i in range(len(lines)):
-            self.logger.debug("[_] %s", lines[i])
-
-            if self.should_stop_processing_doc(lines[i]):
+        transactions = []
+        prev_line = None
+        line = next(lines, None)
+        stops_page = line is not None and self.should_stop_processing_page(line)
+        while line is not None:
+            if debug:
+                self.logger.debug("[_] %s", line)
+
+            if self.should_stop_processing_doc(line):
                 self.logger.info("Document processing stopped")
+                self.doc_complete = True
                 break
-            if self.should_stop_processing_page(lines[i]):
+            if stops_page:
                 self.logger.info("Page processing stopped")
                 break
 
-            if i == 0:
-                prev_line = None
-            else:
-                prev_line = lines[i - 1]
-
-            if i + 1 < len(lines) and not self.should_stop_processing_page(
-                lines[i + 1]
-            ):
-                next_line = lines[i + 1]
-            else:
-                next_line = None
+            next_line = next(lines, None)
+            stops_page = next_line is not None and self.should_stop_processing_page(
+                next_line
+            )
 
-            tx = self.prepare_new_transaction(lines[i], prev_line, next_line)
+            tx = self.prepare_new_transaction(
+                line, prev_line, None if stops_page else next_line
+            )
             if tx:
                 self.logger.info("[T] %s", tx)
                 transactions.append(tx)
 
+            prev_line, line = line, next_line
+
         return transactions
 
     @abstractmethod
     def extract_text(self, page: pdfplumber.page.Page) -> str: ...
 
+    def extract_summary_text(self, page: pdfplumber.page.Page, text: str) -> str:
+        """Text of the first page handed to process_first_page.
+
+        ``text`` is what extract_text returned for that page.
+        """
+        return text
+
     @abstractmethod
     def process_first_page(self, text: str) -> None: ...
 
@@ -169,130 +554,174 @@ class PDFProcessor(ABC):
     ) -> list[Transaction]: ...
 
 
-class BMOChequingPDFProcessor(PDFProcessor):
-    DESC_SLICE = slice(None, 68)
-    CREDIT_SLICE = slice(70, 87)
-    DEBIT_SLICE = slice(90, 107)
-    BALANCE_SLICE = slice(109, 125)
+class BMOPDFProcessor(PDFProcessor):
+    """Transaction rows of BMO statements, laid out as described by FORMAT."""
 
-    TX_PATTERN = re.compile(r"\s+([A-Z][a-z]{2})\s+(\d{1,2})\s+(.+)")
+    FORMAT: StatementFormat
 
-    @classmethod
-    def try_create_processor(
-        cls, first_page: str, logger: logging.Logger
-    ) -> Self | None:
-        if "BMO" in first_page:
-            logger.debug("Looks like a BMO statement")
-            if "Summary of your account" in first_page:
-                logger.debug("Looks like a BMO Banking Account statement")
-                return cls(logger)
-        elif "Summary of your account" in first_page:
-            logger.debug("Looks like a BMO Banking Account statement")
-            return cls(logger)
-        return None
-
-    def __init__(self, logger: logging.Logger):
-        super().__init__(logger)
+    def __init__(self, logger: logging.Logger, plumber_layout: bool = False):
+        super().__init__(logger, plumber_layout)
         self.closing_year = None
-        self.closing_debit = None
-        self.closing_cretit = None
+        self.last_line = None
+        self.last_line_dates = None
 
     def extract_text(self, page: pdfplumber.page.Page) -> str:
-        return page.extract_text(layout=True, x_density=4.5, x_tolerance=1)
-
-    def process_first_page(self, text: str) -> None:
-        for line in text.split("\n"):
-            m = re.fullmatch(
-                r"\s+For\s+the\s+period\s+ending\s+[A-Z][a-z]+\s+\d{2},\s+(\d{4}).*",
-                line,
+        return self.extract_layout_text(page, 4.5)
+
+    def split_line_dates(self, line: str) -> tuple[list[tuple[int, int]], str] | None:
+        # The next line is checked for a date before it becomes the current
+        # line, so keep the last result around instead of splitting it twice.
+        if line is not self.last_line:
+            self.last_line = line
+            self.last_line_dates = split_dates(
+                line[self.FORMAT.desc_slice],
+                self.FORMAT.date_count,
+                self.FORMAT.month_suffix,
             )
-            if m:
-                self.logger.info("Year found: %s", m.group(1))
-                self.closing_year = int(m.group(1))
-                break
+        return self.last_line_dates
 
-        assert self.closing_year is not None, "Year not found"
+    def skip_row(self, note: str) -> bool:
+        """Whether a dated row is skipped before its amounts are read."""
+        return False
 
-    def should_begin_processing_transaction(self, line: str) -> bool:
-        return re.fullmatch(r"\s+Date\s+Description\s+.*", line) is not None
+    def read_summary_row(
+        self, note: str, credit: int | None, debit: int | None
+    ) -> bool:
+        """Whether a dated row is a statement summary, not a transaction."""
+        return False
 
     def prepare_new_transaction(
         self, line: str, prev_line: str | None, next_line: str | None
     ) -> Transaction | None:
-        desc = line[BMOChequingPDFProcessor.DESC_SLICE]
-        credit = line[BMOChequingPDFProcessor.CREDIT_SLICE]
-        debit = line[BMOChequingPDFProcessor.DEBIT_SLICE]
-        balance = line[BMOChequingPDFProcessor.BALANCE_SLICE]
-
-        self.logger.debug("d: [%s]", desc)
-        self.logger.debug("c: [%s]", credit)
-        self.logger.debug("d: [%s]", debit)
-        self.logger.debug("b: [%s]", balance)
-
-        tx_matcher = BMOChequingPDFProcessor.TX_PATTERN.fullmatch(desc)
-        if tx_matcher is None:
-            return None
+        fmt = self.FORMAT
+        if self.debug:
+            self.logger.debug("d: [%s]", line[fmt.desc_slice])
 
-        self.logger.debug("tx_matcher: %s", tx_matcher.groups())
+        tx_dates = self.split_line_dates(line)
+        if tx_dates is None:
+            return None
 
-        note = tx_matcher.group(3).strip()
+        if self.debug:
+            for name, column in (
+                ("c", fmt.credit_slice),
+                ("d", fmt.debit_slice),
+                ("b", fmt.balance_slice),
+                ("a", fmt.amount_slice),
+                ("r", fmt.ref_slice),
+            ):
+                if column is not None:
+                    self.logger.debug("%s: [%s]", name, line[column])
+            self.logger.debug("tx_dates: %s", tx_dates)
 
-        if "Opening balance" in note:
+        dates, note = tx_dates
+        note = note.strip()
+        if self.skip_row(note):
             return None
 
-        if next_line:
-            next_desc = next_line[BMOChequingPDFProcessor.DESC_SLICE]
-            next_credit = next_line[BMOChequingPDFProcessor.CREDIT_SLICE].strip()
-            next_debit = next_line[BMOChequingPDFProcessor.DEBIT_SLICE].strip()
-            next_balance = next_line[BMOChequingPDFProcessor.BALANCE_SLICE].strip()
-
-            next_tx_matcher = BMOChequingPDFProcessor.TX_PATTERN.fullmatch(next_desc)
+        if fmt.joins_next_line and next_line:
+            next_desc = next_line[fmt.desc_slice].strip()
             if (
-                next_tx_matcher is None
-                and next_desc.strip() != ""
-                and next_credit == ""
-                and next_debit == ""
-                and next_balance == ""
+                next_desc != ""
+                and self.split_line_dates(next_line) is None
+                and all(
+                    next_line[column].strip() == ""
+                    for column in (
+                        fmt.credit_slice,
+                        fmt.debit_slice,
+                        fmt.balance_slice,
+                        fmt.amount_slice,
+                    )
+                    if column is not None
+                )
             ):
-                note += " " + next_desc.strip()
-
-        credit = sanitize_amount(credit)
-        debit = sanitize_amount(debit)
-        balance = sanitize_amount(balance)
-
-        if credit:
-            credit = int(credit)
-        else:
-            credit = None
-
-        if debit:
-            debit = int(debit)
-        else:
-            debit = None
+                note += " " + next_desc
 
-        if balance:
-            balance = int(balance)
+        if fmt.amount_slice is not None:
+            cents, is_credit = parse_cents(line[fmt.amount_slice])
+            if cents is None:
+                raise ValueError("Invalid transaction")
+            credit, debit = (None, cents) if is_credit else (cents, None)
         else:
-            balance = None
-
-        if "Closing totals" in note:
-            self.closing_debit = debit
-            self.closing_credit = credit
+            assert fmt.credit_slice is not None and fmt.debit_slice is not None
+            credit, _ = parse_cents(line[fmt.credit_slice])
+            debit, _ = parse_cents(line[fmt.debit_slice])
+        balance = None
+        if fmt.balance_slice is not None:
+            balance, _ = parse_cents(line[fmt.balance_slice])
+
+        if self.read_summary_row(note, credit, debit):
             return None
 
-        month = MONTHS.index(tx_matcher.group(1).lower()) + 1
+        if fmt.collapse_note:
+            note = collapse_whitespace(note)
+        # Statements repeat the same merchants, share one string per payee.
+        payee = sys.intern(note)
+        if fmt.ref_slice is not None:
+            note += " " + line[fmt.ref_slice].strip()
+
         assert self.closing_year, "Statement year not set"
-        tx_date = date(self.closing_year, month, int(tx_matcher.group(2)))
+        tx_date = date(self.closing_year, *dates[0])
+        post_date = date(self.closing_year, *dates[-1])
         return Transaction(
             tx_date=tx_date,
-            post_date=tx_date,
-            payee=note,
+            post_date=post_date,
+            payee=payee,
             credit=credit,
             debit=debit,
             balance=balance,
             note=note,
         )
 
+
+class BMOChequingPDFProcessor(BMOPDFProcessor):
+    MARKERS = ("Summary of your account",)
+
+    FORMAT = StatementFormat(
+        desc_slice=slice(None, 68),
+        date_count=1,
+        credit_slice=slice(70, 87),
+        debit_slice=slice(90, 107),
+        balance_slice=slice(109, 125),
+    )
+
+    YEAR_PATTERN = re.compile(
+        r"\s+For\s+the\s+period\s+ending\s+[A-Z][a-z]+\s+\d{2},\s+(\d{4}).*"
+    )
+
+    def __init__(self, logger: logging.Logger, plumber_layout: bool = False):
+        super().__init__(logger, plumber_layout)
+        self.closing_debit = None
+        self.closing_cretit = None
+
+    def process_first_page(self, text: str) -> None:
+        for line in text.split("\n"):
+            m = BMOChequingPDFProcessor.YEAR_PATTERN.fullmatch(line)
+            if m:
+                self.logger.info("Year found: %s", m.group(1))
+                self.closing_year = int(m.group(1))
+                break
+
+        assert self.closing_year is not None, "Year not found"
+
+    def should_begin_processing_transaction(self, line: str) -> bool:
+        return (
+            line[:1].isspace()
+            and "Date" in line
+            and collapse_whitespace(line).startswith("Date Description")
+        )
+
+    def skip_row(self, note: str) -> bool:
+        return "Opening balance" in note
+
+    def read_summary_row(
+        self, note: str, credit: int | None, debit: int | None
+    ) -> bool:
+        if "Closing totals" in note:
+            self.closing_debit = debit
+            self.closing_credit = credit
+            return True
+        return False
+
     def should_stop_processing_page(self, line: str) -> bool:
         return line.strip() == "continued"
 
@@ -302,21 +731,23 @@ class BMOChequingPDFProcessor(PDFProcessor):
     def post_process_transactions(
         self, transactions: list[Transaction]
     ) -> list[Transaction]:
-        total_credit = 0
-        total_debit = 0
-        for t in transactions:
-            if t.credit is not None:
-                self.logger.debug(
-                    "%-55s  %8d  %8s  %8d", t.payee, t.credit, "", total_credit
-                )
-                total_credit += t.credit
-            elif t.debit is not None:
-                self.logger.debug(
-                    "%-55s  %8s  %8d  %8d", t.payee, "", t.debit, total_debit
-                )
-                total_debit += t.debit
-            else:
-                assert False, f"Transaction has no credit or debit {t}"
+        if self.debug:
+            total_credit = 0
+            total_debit = 0
+            for t in transactions:
+                if t.credit is not None:
+                    self.logger.debug(
+                        "%-55s  %8d  %8s  %8d", t.payee, t.credit, "", total_credit
+                    )
+                    total_credit += t.credit
+                elif t.debit is not None:
+                    self.logger.debug(
+                        "%-55s  %8s  %8d  %8d", t.payee, "", t.debit, total_debit
+                    )
+                    total_debit += t.debit
+
+        total_credit = sum(t.credit for t in transactions if t.credit is not None)
+        total_debit = sum(t.debit for t in transactions if t.debit is not None)
 
         assert total_credit == self.closing_credit, (
             f"Credit mismatch: {total_credit} != {self.closing_credit}"
@@ -328,128 +759,72 @@ class BMOChequingPDFProcessor(PDFProcessor):
         return transactions
 
 
-class BMOMastercardPDFProcessor(PDFProcessor):
-    DESC_SLICE = slice(None, 78)
-    AMOUNT_SLICE = slice(78, 95)
+class BMOMastercardPDFProcessor(BMOPDFProcessor):
+    MARKERS = ("BMO", "Statement date")
 
-    TX_PATTERN = re.compile(
-        r"\s+([A-Z][a-z]{2})\.\s+(\d{1,2})\s+([A-Z][a-z]{2})\.\s+(\d{1,2})\s+(.+)"
+    FORMAT = StatementFormat(
+        desc_slice=slice(None, 78),
+        date_count=2,
+        month_suffix=".",
+        amount_slice=slice(78, 95),
+        collapse_note=True,
     )
 
-    @classmethod
-    def try_create_processor(
-        cls, first_page: str, logger: logging.Logger
-    ) -> Self | None:
-        if "BMO" in first_page:
-            logger.debug("Looks like a BMO statement")
-            if "Statement date" in first_page:
-                logger.debug("Looks like a new version of a BMO Credit Card statement")
-                return cls(logger)
-        return None
+    OPENING_BALANCE_PATTERN = re.compile(
+        r"\s+Previous\s+(?:total\s+)?balance,\s+[A-Z][a-z]{2}\.\s+\d{1,2},\s+\d{4}\s+\$([\d,]+.\d{2}\s+(CR)?).*"
+    )
+    YEAR_PATTERN = re.compile(
+        r".*\s+Statement\s+date\s+[A-Z][a-z]+\.\s+\d{1,2},\s+(\d{4}).*"
+    )
+    CLOSING_BALANCE_PATTERN = re.compile(
+        r"\s+Total\s+balance\s+\$([\d,]+.\d{2})\s+(CR)?.*"
+    )
+    CARD_TOTAL_PATTERN = re.compile(
+        r"\s+Total\s+for\s+card\s+number\s+XXXX\s+XXXX\s+XXXX\s+\d{4}\s+\$([\d,]+\.\d{2})\s+"
+    )
 
-    def __init__(self, logger: logging.Logger):
-        super().__init__(logger)
-        self.closing_year = None
+    def __init__(self, logger: logging.Logger, plumber_layout: bool = False):
+        super().__init__(logger, plumber_layout)
         self.opening_balance = None
         self.closing_balance = None
 
-    def extract_text(self, page: pdfplumber.page.Page) -> str:
-        return page.extract_text(layout=True, x_density=4.5, x_tolerance=1)
-
     def process_first_page(self, text: str) -> None:
         for line in text.split("\n"):
-            if not self.opening_balance:
-                m = re.fullmatch(
-                    r"\s+Previous\s+(?:total\s+)?balance,\s+[A-Z][a-z]{2}\.\s+\d{1,2},\s+\d{4}\s+\$([\d,]+.\d{2}\s+(CR)?).*",
-                    line,
-                )
+            if not self.opening_balance and "Previous" in line:
+                m = BMOMastercardPDFProcessor.OPENING_BALANCE_PATTERN.fullmatch(line)
                 if m:
                     self.logger.info("Opening balance found: %s", m.group(1))
-                    opening_balance = sanitize_amount(m.group(1))
-                    if m.group(2):
-                        self.opening_balance = -int(opening_balance.replace("CR", ""))
-                    else:
-                        self.opening_balance = int(opening_balance)
+                    cents, is_credit = parse_cents(m.group(1))
+                    if cents is None:
+                        raise ValueError("Invalid opening balance")
+                    self.opening_balance = -cents if is_credit else cents
 
-            if not self.closing_year:
-                m = re.fullmatch(
-                    r".*\s+Statement\s+date\s+[A-Z][a-z]+\.\s+\d{1,2},\s+(\d{4}).*",
-                    line,
-                )
+            if not self.closing_year and "Statement" in line:
+                m = BMOMastercardPDFProcessor.YEAR_PATTERN.fullmatch(line)
                 if m:
                     self.logger.info("Year found: %s", m.group(1))
                     self.closing_year = int(m.group(1))
 
-            if not self.closing_balance:
-                m = re.fullmatch(
-                    r"\s+Total\s+balance\s+\$([\d,]+.\d{2})\s+(CR)?.*", line
-                )
+            if not self.closing_balance and "Total" in line:
+                m = BMOMastercardPDFProcessor.CLOSING_BALANCE_PATTERN.fullmatch(line)
                 if m:
                     self.logger.info("Closing balance found: %s", m.group(1))
-                    self.closing_balance = sanitize_amount(m.group(1))
+                    self.closing_balance = int(sanitize_amount(m.group(1)))
                     if m.group(2):
-                        self.closing_balance = -int(
-                            self.closing_balance.replace("CR", "")
-                        )
-                    else:
-                        self.closing_balance = int(self.closing_balance)
+                        self.closing_balance = -self.closing_balance
 
-    def should_begin_processing_transaction(self, line: str) -> bool:
-        return (
-            re.fullmatch(r"\s+DATE\s+DATE\s+DESCRIPTION\s+AMOUNT.*", line) is not None
-        )
-
-    def prepare_new_transaction(
-        self, line: str, prev_line: str | None, next_line: str | None
-    ) -> Transaction | None:
-        desc = line[BMOMastercardPDFProcessor.DESC_SLICE]
-        amount = line[BMOMastercardPDFProcessor.AMOUNT_SLICE]
-
-        self.logger.debug("d: [%s]", desc)
-        self.logger.debug("a: [%s]", amount)
-
-        tx_matcher = BMOMastercardPDFProcessor.TX_PATTERN.fullmatch(desc)
-        if tx_matcher is None:
-            return None
-
-        self.logger.debug("tx_matcher: %s", tx_matcher.groups())
-
-        note = tx_matcher.group(5).strip()
-        if next_line:
-            next_desc = next_line[BMOMastercardPDFProcessor.DESC_SLICE]
-            next_amount = next_line[BMOMastercardPDFProcessor.AMOUNT_SLICE].strip()
-
-            next_tx_matcher = BMOMastercardPDFProcessor.TX_PATTERN.fullmatch(next_desc)
             if (
-                next_tx_matcher is None
-                and next_desc.strip() != ""
-                and next_amount == ""
+                self.closing_year
+                and self.opening_balance is not None
+                and self.closing_balance is not None
             ):
-                note += " " + next_desc.strip()
-
-        amount = sanitize_amount(amount)
-        if "CR" in amount:
-            credit = None
-            debit = int(amount.replace("CR", ""))
-        else:
-            credit = int(amount)
-            debit = None
-
-        note = sanitize_string(note)
+                break
 
-        tx_month = MONTHS.index(tx_matcher.group(1).lower()) + 1
-        post_month = MONTHS.index(tx_matcher.group(3).lower()) + 1
-        assert self.closing_year, "Statement year not set"
-        tx_date = date(self.closing_year, tx_month, int(tx_matcher.group(2)))
-        post_date = date(self.closing_year, post_month, int(tx_matcher.group(4)))
-        return Transaction(
-            tx_date=tx_date,
-            post_date=post_date,
-            payee=note,
-            credit=credit,
-            debit=debit,
-            balance=None,
-            note=note,
+    def should_begin_processing_transaction(self, line: str) -> bool:
+        return (
+            line[:1].isspace()
+            and "DATE" in line
+            and collapse_whitespace(line).startswith("DATE DATE DESCRIPTION AMOUNT")
         )
 
     def should_stop_processing_page(self, line: str) -> bool:
@@ -457,11 +832,11 @@ class BMOMastercardPDFProcessor(PDFProcessor):
 
     def should_stop_processing_doc(self, line: str) -> bool:
         if not self.closing_balance:
-            closing_matcher = re.fullmatch(
-                r"\s+Total\s+for\s+card\s+number\s+XXXX\s+XXXX\s+XXXX\s+\d{4}\s+\$([\d,]+\.\d{2})\s+",
-                line,
+            closing_matcher = BMOMastercardPDFProcessor.CARD_TOTAL_PATTERN.fullmatch(
+                line
             )
-            self.logger.debug(closing_matcher)
+            if self.debug:
+                self.logger.debug(closing_matcher)
             if not closing_matcher:
                 return False
 
@@ -474,20 +849,21 @@ class BMOMastercardPDFProcessor(PDFProcessor):
     ) -> list[Transaction]:
         assert self.opening_balance is not None, "Opening balance not found"
         assert self.closing_balance is not None, "Closing balance not found"
-        total_amount = 0
-        for t in transactions:
-            if t.credit is not None:
-                total_amount += t.credit
-                self.logger.debug(
-                    "%-60s  %8d  %8s  %8d", t.payee, t.credit, "", total_amount
-                )
-            elif t.debit is not None:
-                total_amount -= t.debit
-                self.logger.debug(
-                    "%-60s  %8s  %8d  %8d", t.payee, "", t.debit, total_amount
-                )
-            else:
-                assert False, f"Transaction has no credit or debit {t}"
+        if self.debug:
+            total_amount = 0
+            for t in transactions:
+                if t.credit is not None:
+                    total_amount += t.credit
+                    self.logger.debug(
+                        "%-60s  %8d  %8s  %8d", t.payee, t.credit, "", total_amount
+                    )
+                elif t.debit is not None:
+                    total_amount -= t.debit
+                    self.logger.debug(
+                        "%-60s  %8s  %8d  %8d", t.payee, "", t.debit, total_amount
+                    )
+
+        total_amount = sum(t.amount for t in transactions)
 
         assert total_amount + self.opening_balance == self.closing_balance, (
             "Balance mismatch"
@@ -496,57 +872,56 @@ class BMOMastercardPDFProcessor(PDFProcessor):
 
 
 class OldBMOMastercardPDFProcessor(BMOMastercardPDFProcessor):
-    DESC_SLICE = slice(None, 85)
-    REF_SLICE = slice(88, 115)
-    AMOUNT_SLICE = slice(118, 135)
-
-    TX_PATTERN = re.compile(
-        r"\s+([A-Z][a-z]{2})\.\s+(\d{1,2})\s+([A-Z][a-z]{2})\.\s+(\d{1,2})\s+(.+)"
+    MARKERS = ("BMO", "Statement Date")
+
+    FORMAT = StatementFormat(
+        desc_slice=slice(None, 85),
+        date_count=2,
+        month_suffix=".",
+        amount_slice=slice(118, 135),
+        ref_slice=slice(88, 115),
+        joins_next_line=False,
+        collapse_note=True,
     )
 
-    @classmethod
-    def try_create_processor(
-        cls, first_page: str, logger: logging.Logger
-    ) -> Self | None:
-        if "BMO" in first_page:
-            logger.debug("Looks like a BMO statement")
-            if "Statement Date" in first_page:
-                logger.debug("Looks like an old version of a BMO Credit Card statement")
-                return cls(logger)
-        return None
+    YEAR_PATTERN = re.compile(
+        r".*\s+Statement\s+Date\s+[A-Z][a-z]+\.\s+\d{1,2},\s+(\d{4}).*"
+    )
+    OPENING_BALANCE_PATTERN = re.compile(
+        r".*\s+Previous\s+Balance,\s+[A-Z][a-z]{2}\.\s+\d{1,2},\s+\d{4}\s+\$([\d,]+.\d{2}).*"
+    )
+    CLOSING_BALANCE_PATTERN = re.compile(
+        r".*\s+New\s+Balance,\s+[A-Z][a-z]{2}\.\s+\d{1,2},\s+\d{4}\s+\$([\d,]+.\d{2})(\s+CR)?.*"
+    )
 
     def process_first_page(self, text: str) -> None:
         for line in text.split("\n"):
-            if not self.closing_year:
-                m = re.fullmatch(
-                    r".*\s+Statement\s+Date\s+[A-Z][a-z]+\.\s+\d{1,2},\s+(\d{4}).*",
-                    line,
-                )
+            if not self.closing_year and "Statement" in line:
+                m = OldBMOMastercardPDFProcessor.YEAR_PATTERN.fullmatch(line)
                 if m:
                     self.logger.info("Year found: %s", m.group(1))
                     self.closing_year = int(m.group(1))
 
-            if not self.opening_balance:
-                m = re.fullmatch(
-                    r".*\s+Previous\s+Balance,\s+[A-Z][a-z]{2}\.\s+\d{1,2},\s+\d{4}\s+\$([\d,]+.\d{2}).*",
-                    line,
-                )
+            if not self.opening_balance and "Previous" in line:
+                m = OldBMOMastercardPDFProcessor.OPENING_BALANCE_PATTERN.fullmatch(line)
                 if m:
                     self.logger.info("Opening balance found: %s", m.group(1))
                     self.opening_balance = int(sanitize_amount(m.group(1)))
 
-            if not self.closing_balance:
-                m = re.fullmatch(
-                    r".*\s+New\s+Balance,\s+[A-Z][a-z]{2}\.\s+\d{1,2},\s+\d{4}\s+\$([\d,]+.\d{2})(\s+CR)?.*",
-                    line,
-                )
+            if not self.closing_balance and "New" in line:
+                m = OldBMOMastercardPDFProcessor.CLOSING_BALANCE_PATTERN.fullmatch(line)
                 if m:
                     self.logger.info("Closing balance found: %s", m.groups())
-                    closing_balance = sanitize_amount(m.group(1))
-                    if m.group(2) and m.group(2).strip() == "CR":
-                        self.closing_balance = -int(closing_balance.replace("CR", ""))
-                    else:
-                        self.closing_balance = int(closing_balance)
+                    self.closing_balance = int(sanitize_amount(m.group(1)))
+                    if m.group(2):
+                        self.closing_balance = -self.closing_balance
+
+            if (
+                self.closing_year
+                and self.opening_balance is not None
+                and self.closing_balance is not None
+            ):
+                break
 
         assert self.closing_year, "Statement year not set"
         assert self.opening_balance is not None, "Opening balance not set"
@@ -554,103 +929,65 @@ class OldBMOMastercardPDFProcessor(BMOMastercardPDFProcessor):
 
     def should_begin_processing_transaction(self, line: str) -> bool:
         return (
-            re.fullmatch(
-                r"\s+DATE\s+DATE\s+DESCRIPTION\s+REFERENCE\sNO\.\s+AMOUNT.*", line
+            line[:1].isspace()
+            and "DATE" in line
+            and collapse_whitespace(line).startswith(
+                "DATE DATE DESCRIPTION REFERENCE NO. AMOUNT"
             )
-            is not None
-        )
-
-    def prepare_new_transaction(
-        self, line: str, prev_line: str | None, next_line: str | None
-    ) -> Transaction | None:
-        desc = line[OldBMOMastercardPDFProcessor.DESC_SLICE]
-        reference = line[OldBMOMastercardPDFProcessor.REF_SLICE]
-        amount = line[OldBMOMastercardPDFProcessor.AMOUNT_SLICE]
-
-        self.logger.debug("d: [%s]", desc)
-        self.logger.debug("r: [%s]", reference)
-        self.logger.debug("a: [%s]", amount)
-
-        tx_matcher = OldBMOMastercardPDFProcessor.TX_PATTERN.fullmatch(desc)
-        if tx_matcher is None:
-            return None
-
-        self.logger.debug("tx_matcher: %s", tx_matcher.groups())
-
-        note = tx_matcher.group(5).strip()
-
-        amount = sanitize_amount(amount)
-        if "CR" in amount:
-            credit = None
-            debit = int(amount.replace("CR", ""))
-        else:
-            credit = int(amount)
-            debit = None
-
-        note = sanitize_string(note)
-
-        tx_month = MONTHS.index(tx_matcher.group(1).lower()) + 1
-        post_month = MONTHS.index(tx_matcher.group(3).lower()) + 1
-        assert self.closing_year, "Statement year not set"
-        tx_date = date(self.closing_year, tx_month, int(tx_matcher.group(2)))
-        post_date = date(self.closing_year, post_month, int(tx_matcher.group(4)))
-        return Transaction(
-            tx_date=tx_date,
-            post_date=post_date,
-            payee=note,
-            credit=credit,
-            debit=debit,
-            balance=None,
-            note=note + " " + reference.strip(),
         )
 
 
 class RBCChequingPDFProcessor(PDFProcessor):
+    MARKERS = ("Royal Bank of Canada", "Total deposits")
+
     DESC_SLICE = slice(None, 60)
     CREDIT_SLICE = slice(68, 85)
     DEBIT_SLICE = slice(88, 110)
 
     TX_PATTERN = re.compile(r"\s+(\d{1,2})\s+([A-Z][a-z]{2})\s+(.+)")
+    STOP_PAGE_PATTERN = re.compile(
+        "|".join(
+            map(
+                re.escape,
+                [
+                    "Please check this Account Statement without delay",
+                    "Closing Balance",
+                    "No activity for this period",
+                ],
+            )
+        )
+    )
+    OPENING_BALANCE_PATTERN = re.compile(
+        r"\s+Your\s+opening\s+balance\s+(?:on\s+[A-Z][a-z]*\s+\d+,\s+\d{4}\s+)?((?:-\s*)?\$[\d,]+.\d{2}).*"
+    )
+    CLOSING_BALANCE_PATTERN = re.compile(
+        r"\s+Your\s+closing\s+balance\s+on\s+([A-Z][a-z]{2})[a-z]*\s+(\d+),\s+(\d{4})\s+=\s+((?:-\s*)?\$[\d,]+.\d{2}).*"
+    )
 
-    @classmethod
-    def try_create_processor(
-        cls, first_page: str, logger: logging.Logger
-    ) -> Self | None:
-        if re.search(r"\s*Royal\s+Bank\s+of\s+Canada\s*", first_page):
-            logger.info("Found RBC header")
-            if re.search(r".*Total\s+deposits.*", first_page):
-                logger.info("Definitely an RBC bank account")
-                return cls(logger)
-        return None
-
-    def __init__(self, logger: logging.Logger):
-        super().__init__(logger)
+    def __init__(self, logger: logging.Logger, plumber_layout: bool = False):
+        super().__init__(logger, plumber_layout)
         self.closing_year = None
         self.opening_balance = None
         self.closing_balance = None
         self.last_transaction_date = None
-        self.pending_tx = None
+        # Description lines of a transaction whose amount is on a later line.
+        self.pending_tx_date = None
+        self.pending_note_parts: list[str] = []
 
     def extract_text(self, page: pdfplumber.page.Page) -> str:
-        return page.extract_text(layout=True, x_density=4.5, x_tolerance=1)
+        return self.extract_layout_text(page, 4.5)
 
     def process_first_page(self, text: str) -> None:
         for line in text.split("\n"):
             if not self.opening_balance:
-                m = re.fullmatch(
-                    r"\s+Your\s+opening\s+balance\s+(?:on\s+[A-Z][a-z]*\s+\d+,\s+\d{4}\s+)?((?:-\s*)?\$[\d,]+.\d{2}).*",
-                    line,
-                )
+                m = RBCChequingPDFProcessor.OPENING_BALANCE_PATTERN.fullmatch(line)
                 if m:
                     self.logger.info("Opening balance found: %s", m.group(1))
                     opening_balance = sanitize_amount(m.group(1))
                     self.opening_balance = int(opening_balance)
 
             if not self.closing_balance:
-                m = re.fullmatch(
-                    r"\s+Your\s+closing\s+balance\s+on\s+([A-Z][a-z]{2})[a-z]*\s+(\d+),\s+(\d{4})\s+=\s+((?:-\s*)?\$[\d,]+.\d{2}).*",
-                    line,
-                )
+                m = RBCChequingPDFProcessor.CLOSING_BALANCE_PATTERN.fullmatch(line)
                 if m:
                     self.logger.info("Closing balance found: %s", m.group(4))
                     closing_balance = sanitize_amount(m.group(4))
@@ -665,26 +1002,29 @@ class RBCChequingPDFProcessor(PDFProcessor):
 
     def should_begin_processing_transaction(self, line: str) -> bool:
         return (
-            re.fullmatch(r"\s+Date\s+Description\s+Withdrawals\s+.*", line) is not None
+            line[:1].isspace()
+            and "Date" in line
+            and collapse_whitespace(line).startswith("Date Description Withdrawals")
         )
 
     def prepare_new_transaction(
         self, line: str, prev_line: str | None, next_line: str | None
     ) -> Transaction | None:
-        if any(["No activity for this period" in line, "Opening Balance" in line]):
+        if "No activity for this period" in line or "Opening Balance" in line:
             return None
 
         desc = line[RBCChequingPDFProcessor.DESC_SLICE]
         credit = line[RBCChequingPDFProcessor.CREDIT_SLICE]
         debit = line[RBCChequingPDFProcessor.DEBIT_SLICE]
 
-        self.logger.debug("D: [%s]", desc)
-        self.logger.debug("c: [%s]", credit)
-        self.logger.debug("d: [%s]", debit)
+        if self.debug:
+            self.logger.debug("D: [%s]", desc)
+            self.logger.debug("c: [%s]", credit)
+            self.logger.debug("d: [%s]", debit)
 
         tx_matcher = RBCChequingPDFProcessor.TX_PATTERN.fullmatch(desc)
         if tx_matcher:
-            tx_month = MONTHS.index(tx_matcher.group(2).lower()) + 1
+            tx_month = MONTH_INDEX[tx_matcher.group(2)]
             assert self.closing_year, "Statement year not set"
             note = tx_matcher.group(3).strip()
             tx_date = date(self.closing_year, tx_month, int(tx_matcher.group(1)))
@@ -694,13 +1034,9 @@ class RBCChequingPDFProcessor(PDFProcessor):
             tx_date = self.last_transaction_date
 
         if credit.strip() == "" and debit.strip() == "":
-            if self.pending_tx:
-                self.pending_tx.payee += " " + note
-                self.pending_tx.note += " " + note
-            else:
-                self.pending_tx = Transaction(
-                    tx_date, tx_date, note, 0, None, None, note
-                )
+            if not self.pending_note_parts:
+                self.pending_tx_date = tx_date
+            self.pending_note_parts.append(note)
             self.last_transaction_date = tx_date
             return None
 
@@ -713,35 +1049,20 @@ class RBCChequingPDFProcessor(PDFProcessor):
         else:
             raise ValueError("Invalid transaction")
 
-        if self.pending_tx:
-            self.pending_tx.payee += " " + note
-            self.pending_tx.note += " " + note
-
-            self.pending_tx.credit = credit
-            self.pending_tx.debit = debit
-            self.pending_tx.__post_init__()
-            returning_tx = self.pending_tx
-            self.pending_tx = None
-        else:
-            returning_tx = Transaction(
-                tx_date, tx_date, note, credit, debit, None, note
-            )
-
         self.last_transaction_date = tx_date
 
-        returning_tx.payee = sanitize_string(returning_tx.payee)
-        returning_tx.note = sanitize_string(returning_tx.note)
+        if self.pending_note_parts:
+            self.pending_note_parts.append(note)
+            note = " ".join(self.pending_note_parts)
+            self.pending_note_parts = []
+            assert self.pending_tx_date, "Pending transaction date not set"
+            tx_date = self.pending_tx_date
 
-        return returning_tx
+        note = sys.intern(sanitize_string(note))
+        return Transaction(tx_date, tx_date, note, credit, debit, None, note)
 
     def should_stop_processing_page(self, line: str) -> bool:
-        return any(
-            [
-                "Please check this Account Statement without delay" in line,
-                "Closing Balance" in line,
-                "No activity for this period" in line,
-            ]
-        )
+        return RBCChequingPDFProcessor.STOP_PAGE_PATTERN.search(line) is not None
 
     def should_stop_processing_doc(self, line: str) -> bool:
         return False
@@ -751,20 +1072,23 @@ class RBCChequingPDFProcessor(PDFProcessor):
     ) -> list[Transaction]:
         assert self.opening_balance is not None, "Opening balance not found"
         assert self.closing_balance is not None, "Closing balance not found"
-        total_amount = 0
-        for t in transactions:
-            if t.credit is not None:
-                total_amount -= t.credit
-                self.logger.debug(
-                    "%-60s  %8d  %8s  %8d", t.payee, t.credit, "", total_amount
-                )
-            elif t.debit is not None:
-                total_amount += t.debit
-                self.logger.debug(
-                    "%-60s  %8s  %8d  %8d", t.payee, "", t.debit, total_amount
-                )
-            else:
-                assert False, f"Transaction has no credit or debit {t}"
+        if self.debug:
+            total_amount = 0
+            for t in transactions:
+                if t.credit is not None:
+                    total_amount -= t.credit
+                    self.logger.debug(
+                        "%-60s  %8d  %8s  %8d", t.payee, t.credit, "", total_amount
+                    )
+                elif t.debit is not None:
+                    total_amount += t.debit
+                    self.logger.debug(
+                        "%-60s  %8s  %8d  %8d", t.payee, "", t.debit, total_amount
+                    )
+
+        # Withdrawals are credits and deposits debits, the account balance
+        # moves against Transaction.amount.
+        total_amount = -sum(t.amount for t in transactions)
 
         assert total_amount + self.opening_balance == self.closing_balance, (
             f"Balance mismatch ({total_amount} + {self.opening_balance}) ≠ {self.closing_balance}"
@@ -773,49 +1097,53 @@ class RBCChequingPDFProcessor(PDFProcessor):
 
 
 class RBCMastercardPDFProcessor(PDFProcessor):
-    @classmethod
-    def try_create_processor(
-        cls, first_page: str, logger: logging.Logger
-    ) -> Self | None:
-        if "RBC" in first_page and "Mastercard" in first_page:
-            logger.info("Definitely an RBC Mastercard")
-            return cls(logger)
-        return None
+    MARKERS = ("RBC", "Mastercard")
 
-    def __init__(self, logger: logging.Logger):
-        super().__init__(logger)
+    YEAR_PATTERN = re.compile(
+        r".*STATEMENT\s+FROM\s+(\w+)\s+(\d+)(?:,\s+(\d{4}))?\s+TO\s+(\w+)\s+(\d+),\s+(\d{4}).*"
+    )
+    OPENING_BALANCE_PATTERN = re.compile(
+        r".*Previous\s+(?:Statement|Account)\s+Balance\s+((?:-)?\$[\d,]+\.\d{2}).*"
+    )
+    CLOSING_BALANCE_PATTERN = re.compile(
+        r".*(?:NEW|CREDIT)\s+BALANCE\s+((?:-)?\$[\d,]+\.\d{2}).*"
+    )
+    HEADER_PATTERN = re.compile(r"DATE\s+DATE\s")
+    TX_PATTERN = re.compile(r"\s+([A-Z]{3})\s+(\d{2})\s+([A-Z]{3})\s+(\d{2})\s+(.+)")
+    # Payees listed without a transaction reference line.
+    UNREFERENCED_PAYEE_PATTERN = re.compile(
+        r"BALANCEPROTECTOR\s+PREMIUM|AUTOMATIC\s+PAYMENT\s+-\s+THANK\s+YOU"
+    )
+    NEW_BALANCE_PATTERN = re.compile(r"NEW\s+BALANCE")
+
+    def __init__(self, logger: logging.Logger, plumber_layout: bool = False):
+        super().__init__(logger, plumber_layout)
         self.opening_balance = None
         self.closing_balance = None
         self.closing_year = None
 
     def extract_text(self, page: pdfplumber.page.Page) -> str:
         cropped_box = (0, 0, 0.6 * page.width, page.height)
-        cropped_page = page.within_bbox(cropped_box)
+        return self.extract_layout_text(page, 4, bbox=cropped_box)
 
-        return cropped_page.extract_text(layout=True, x_density=4, x_tolerance=1)
+    def extract_summary_text(self, page: pdfplumber.page.Page, text: str) -> str:
+        # The balances are printed right of the transaction columns.
+        return self.extract_layout_text(page, DEFAULT_X_DENSITY)
 
     def process_first_page(self, text: str) -> None:
         for line in text.split("\n"):
             if not self.closing_year:
-                m = re.match(
-                    r".*STATEMENT\s+FROM\s+(\w+)\s+(\d+)(?:,\s+(\d{4}))?\s+TO\s+(\w+)\s+(\d+),\s+(\d{4}).*",
-                    line,
-                )
+                m = RBCMastercardPDFProcessor.YEAR_PATTERN.match(line)
                 if m:
                     self.logger.info("Year %s", m.group(6))
                     self.closing_year = int(m.group(6))
             if not self.opening_balance:
-                m = re.match(
-                    r".*Previous\s+(?:Statement|Account)\s+Balance\s+((?:-)?\$[\d,]+\.\d{2}).*",
-                    line,
-                )
+                m = RBCMastercardPDFProcessor.OPENING_BALANCE_PATTERN.match(line)
                 if m:
                     self.logger.info("Opening balance %s", m.group(1))
                     self.opening_balance = int(sanitize_amount(m.group(1)))
             if not self.closing_balance:
-                m = re.match(
-                    r".*(?:NEW|CREDIT)\s+BALANCE\s+((?:-)?\$[\d,]+\.\d{2}).*", line
-                )
+                m = RBCMastercardPDFProcessor.CLOSING_BALANCE_PATTERN.match(line)
                 if m:
                     self.logger.info("Closing balance %s", m.group(1))
                     self.closing_balance = int(sanitize_amount(m.group(1)))
@@ -825,7 +1153,10 @@ class RBCMastercardPDFProcessor(PDFProcessor):
         assert self.closing_balance is not None, "Closing balance not set"
 
     def should_begin_processing_transaction(self, line: str) -> bool:
-        return re.match(r".*DATE\s+DATE\s+.*", line) is not None
+        return (
+            "DATE" in line
+            and RBCMastercardPDFProcessor.HEADER_PATTERN.search(line) is not None
+        )
 
     def prepare_new_transaction(
         self, line: str, prev_line: str | None, next_line: str | None
@@ -835,28 +1166,21 @@ class RBCMastercardPDFProcessor(PDFProcessor):
         desc = line[:74]
         amount = line[76:93]
 
-        m = re.match(r"\s+([A-Z]{3})\s+(\d{2})\s+([A-Z]{3})\s+(\d{2})\s+(.+)", desc)
+        m = RBCMastercardPDFProcessor.TX_PATTERN.match(desc)
         if m:
-            tx_month = MONTHS.index(m.group(1).lower()) + 1
+            tx_month = MONTH_INDEX[m.group(1)]
             tx_date = date(self.closing_year, tx_month, int(m.group(2)))
-            post_month = MONTHS.index(m.group(3).lower()) + 1
+            post_month = MONTH_INDEX[m.group(3)]
             post_date = date(self.closing_year, post_month, int(m.group(4)))
             payee = m.group(5).strip()
 
-            if any(
-                [
-                    re.match(r"BALANCEPROTECTOR\s+PREMIUM", payee),
-                    re.match(r"AUTOMATIC\s+PAYMENT\s+-\s+THANK\s+YOU", payee),
-                ]
-            ):
+            if RBCMastercardPDFProcessor.UNREFERENCED_PAYEE_PATTERN.match(payee):
                 note = None
             else:
-                if (
-                    not next_line
-                    or re.match(r"\d{11,23}", next_line[:76].strip()) is None
-                ):
+                # The reference line starts with at least 11 digits.
+                note = next_line[:76].strip() if next_line else ""
+                if len(note) < 11 or not note[:11].isdecimal():
                     raise ValueError("No transaction reference found")
-                note = next_line[:76].strip()
         else:
             return None
 
@@ -869,7 +1193,7 @@ class RBCMastercardPDFProcessor(PDFProcessor):
             credit = None
             debit = -amount
 
-        payee = sanitize_string(payee)
+        payee = sys.intern(sanitize_string(payee))
 
         return Transaction(
             tx_date=tx_date,
@@ -885,7 +1209,7 @@ class RBCMastercardPDFProcessor(PDFProcessor):
         return False
 
     def should_stop_processing_doc(self, line: str) -> bool:
-        return re.match(r".*NEW\s+BALANCE.*", line) is not None
+        return RBCMastercardPDFProcessor.NEW_BALANCE_PATTERN.search(line) is not None
 
     def post_process_transactions(
         self, transactions: list[Transaction]
@@ -893,37 +1217,44 @@ class RBCMastercardPDFProcessor(PDFProcessor):
         assert self.opening_balance is not None, "Opening balance not set"
         assert self.closing_balance is not None, "Closing balance not set"
 
-        new_balance = self.opening_balance
-        for tx in transactions:
-            if tx.credit is not None:
-                new_balance += tx.credit
-                self.logger.debug(
-                    "%-60s  %8d  %8s  %8d", tx.payee, tx.credit, "", new_balance
-                )
-            elif tx.debit is not None:
-                new_balance -= tx.debit
-                self.logger.debug(
-                    "%-60s  %8s  %8d  %8d", tx.payee, "", tx.debit, new_balance
-                )
+        if self.debug:
+            new_balance = self.opening_balance
+            for tx in transactions:
+                if tx.credit is not None:
+                    new_balance += tx.credit
+                    self.logger.debug(
+                        "%-60s  %8d  %8s  %8d", tx.payee, tx.credit, "", new_balance
+                    )
+                elif tx.debit is not None:
+                    new_balance -= tx.debit
+                    self.logger.debug(
+                        "%-60s  %8s  %8d  %8d", tx.payee, "", tx.debit, new_balance
+                    )
+
+        new_balance = self.opening_balance + sum(tx.amount for tx in transactions)
 
         assert new_balance == self.closing_balance, "Balance mismatch"
         return transactions
 
 
 class RBCInvestPDFProcessor(PDFProcessor):
+    MARKERS = ("Royal Mutual Funds Inc.",)
+
     AMOUNT_SLICE = slice(65, 82)
 
-    @classmethod
-    def try_create_processor(
-        cls, first_page: str, logger: logging.Logger
-    ) -> Self | None:
-        if "Royal Mutual Funds Inc." in first_page:
-            logger.debug("Definitely RBC Mutual Funds")
-            return cls(logger)
-        return None
+    PERIOD_PATTERN = re.compile(
+        r"\s+[A-Z][a-z]+\s+\d+,\s+\d{4}\s+to\s+([A-Z][a-z]{2})[a-z]*\s+(\d+),\s+(\d{4})\s*"
+    )
+    OPENING_BALANCE_PATTERN = re.compile(r"\s*Beginning\s+account\s+value\s*")
+    CLOSING_BALANCE_PATTERN = re.compile(r"\s*Value\s+of\s+your\s+account\s+on\s*")
+    AMOUNT_IN_PATTERN = re.compile(r"\s*Amount\s+in\s*")
+    AMOUNT_OUT_PATTERN = re.compile(r"\s*Amount\s+out\s*")
+    CHANGE_IN_VALUE_PATTERN = re.compile(
+        r"\s*Change\s+in\s+the\s+value\s+of\s+your\s+account\s*"
+    )
 
-    def __init__(self, logger: logging.Logger):
-        super().__init__(logger)
+    def __init__(self, logger: logging.Logger, plumber_layout: bool = False):
+        super().__init__(logger, plumber_layout)
         self.opening_balance = 0
         self.closing_balance = None
         self.amount_in = None
@@ -932,19 +1263,16 @@ class RBCInvestPDFProcessor(PDFProcessor):
         self.closing_date = None
 
     def extract_text(self, page: pdfplumber.page.Page) -> str:
-        return page.extract_text(layout=True, x_density=4.5, x_tolerance=1)
+        return self.extract_layout_text(page, 4.5)
 
     def process_first_page(self, text: str) -> None:
         for line in text.split("\n"):
             if self.closing_date is None:
-                m = re.fullmatch(
-                    r"\s+[A-Z][a-z]+\s+\d+,\s+\d{4}\s+to\s+([A-Z][a-z]{2})[a-z]*\s+(\d+),\s+(\d{4})\s*",
-                    line,
-                )
+                m = RBCInvestPDFProcessor.PERIOD_PATTERN.fullmatch(line)
                 if m:
                     self.logger.debug("Closing year: [%s]", m.group(1))
                     year = int(m.group(3))
-                    month = MONTHS.index(m.group(1).lower()) + 1
+                    month = MONTH_INDEX[m.group(1)]
                     day = int(m.group(2))
                     self.closing_date = date(year, month, day)
 
@@ -956,64 +1284,48 @@ class RBCInvestPDFProcessor(PDFProcessor):
     def prepare_new_transaction(
         self, line: str, prev_line: str | None, next_line: str | None
     ) -> Transaction | None:
+        amount = line[RBCInvestPDFProcessor.AMOUNT_SLICE]
+
         if self.opening_balance == 0:
-            if re.match(r"\s*Beginning\s+account\s+value\s*", line):
-                self.logger.debug(
-                    "Opening balance: [%s]", line[RBCInvestPDFProcessor.AMOUNT_SLICE]
-                )
-                if line[RBCInvestPDFProcessor.AMOUNT_SLICE].strip() != "":
-                    self.opening_balance = int(
-                        sanitize_amount(line[RBCInvestPDFProcessor.AMOUNT_SLICE])
-                    )
+            if RBCInvestPDFProcessor.OPENING_BALANCE_PATTERN.match(line):
+                self.logger.debug("Opening balance: [%s]", amount)
+                if amount.strip() != "":
+                    self.opening_balance = int(sanitize_amount(amount))
                     return None
 
         if self.closing_balance is None:
-            if re.match(r"\s*Value\s+of\s+your\s+account\s+on\s*", line):
-                self.logger.debug(
-                    "Closing balance: [%s]", line[RBCInvestPDFProcessor.AMOUNT_SLICE]
-                )
-                self.closing_balance = int(
-                    sanitize_amount(line[RBCInvestPDFProcessor.AMOUNT_SLICE])
-                )
+            if RBCInvestPDFProcessor.CLOSING_BALANCE_PATTERN.match(line):
+                self.logger.debug("Closing balance: [%s]", amount)
+                self.closing_balance = int(sanitize_amount(amount))
                 return None
 
         if self.amount_in is None:
-            if re.match(r"\s*Amount\s+in\s*", line):
+            if RBCInvestPDFProcessor.AMOUNT_IN_PATTERN.match(line):
                 try:
-                    self.logger.debug(
-                        "Amount in: [%s]", line[RBCInvestPDFProcessor.AMOUNT_SLICE]
-                    )
-                    self.amount_in = int(
-                        sanitize_amount(line[RBCInvestPDFProcessor.AMOUNT_SLICE])
-                    )
+                    self.logger.debug("Amount in: [%s]", amount)
+                    self.amount_in = int(sanitize_amount(amount))
                 except ValueError:
                     self.amount_in = 0
                 return None
 
         if self.amount_out is None:
-            if re.match(r"\s*Amount\s+out\s*", line):
+            if RBCInvestPDFProcessor.AMOUNT_OUT_PATTERN.match(line):
                 try:
-                    self.logger.debug(
-                        "Amount out: [%s]", line[RBCInvestPDFProcessor.AMOUNT_SLICE]
-                    )
-                    self.amount_out = -int(
-                        sanitize_amount(line[RBCInvestPDFProcessor.AMOUNT_SLICE])
-                    )
+                    self.logger.debug("Amount out: [%s]", amount)
+                    self.amount_out = -int(sanitize_amount(amount))
                 except ValueError:
                     self.amount_out = 0
                 return None
 
         if self.change_in_value is None:
-            if re.match(r"\s*Change\s+in\s+the\s+value\s+of\s+your\s+account\s*", line):
+            if RBCInvestPDFProcessor.CHANGE_IN_VALUE_PATTERN.match(line):
                 if line[65:80].strip() != "":
                     try:
                         self.logger.debug(
                             "Change in value: [%s]",
-                            line[RBCInvestPDFProcessor.AMOUNT_SLICE],
-                        )
-                        self.change_in_value = int(
-                            sanitize_amount(line[RBCInvestPDFProcessor.AMOUNT_SLICE])
+                            amount,
                         )
+                        self.change_in_value = int(sanitize_amount(amount))
                     except ValueError:
                         self.change_in_value = 0
                     return None
@@ -1024,14 +1336,12 @@ class RBCInvestPDFProcessor(PDFProcessor):
         return False
 
     def should_stop_processing_doc(self, line: str) -> bool:
-        return all(
-            [
-                self.closing_date is not None,
-                self.closing_balance is not None,
-                self.amount_in is not None,
-                self.amount_out is not None,
-                self.change_in_value is not None,
-            ]
+        return (
+            self.closing_date is not None
+            and self.closing_balance is not None
+            and self.amount_in is not None
+            and self.amount_out is not None
+            and self.change_in_value is not None
         )
 
     def post_process_transactions(
@@ -1107,3 +1417,14 @@ class RBCInvestPDFProcessor(PDFProcessor):
             )
 
         return transactions
+
+
+# Processors tried in order by PDFProcessor.process, built once at import.
+PROCESSORS: tuple[type[PDFProcessor], ...] = (
+    OldBMOMastercardPDFProcessor,
+    BMOMastercardPDFProcessor,
+    BMOChequingPDFProcessor,
+    RBCChequingPDFProcessor,
+    RBCMastercardPDFProcessor,
+    RBCInvestPDFProcessor,
+)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import date
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Transaction:
     tx_date: date
     post_date: date
@@ -13,10 +13,23 @@ class Transaction:
     note: str | None
 
     def __post_init__(self):
-        assert (self.credit is None) != (self.debit is None), (
-            f"Invalid transaction {self}"
-        )
+        # Raised rather than asserted so that validation survives python -O.
+        credit, debit = self.credit, self.debit
+        if credit is not None:
+            valid = debit is None and credit >= 0
+        else:
+            valid = debit is not None and debit >= 0
+        if not valid:
+            raise ValueError(f"Invalid transaction {self}")
+
+    @property
+    def amount(self) -> int:
+        """Signed amount in cents: credit as is, debit negated.
+
+        Processors record money spent (purchases, withdrawals) as credit, so
+        this is positive for spending. The CLI prints the opposite sign.
+        """
         if self.credit is not None:
-            assert self.credit >= 0, f"Invalid transaction {self}"
-        if self.debit is not None:
-            assert self.debit >= 0, f"Invalid transaction {self}"
+            return self.credit
+        assert self.debit is not None
+        return -self.debit
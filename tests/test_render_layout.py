@@ -0,0 +1,92 @@
+import io
+import unittest
+
+import pdfplumber
+
+from mapleteller.domain.services.pdfprocessor import render_layout
+
+# (x, y, size, text) drawn in Courier on a letter page, y from the bottom.
+LINES = [
+    (40, 740, 9, "Summary of your account"),
+    (40, 720, 7, "Date"),
+    (76, 720, 7, "Description"),
+    (340, 720, 7, "Amounts deducted"),
+    (430, 720, 7, "Balance"),
+    (40, 708, 7, "Mar 01"),
+    (76, 708, 7, "Opening balance"),
+    (455, 708, 7, "1,000.00"),
+    (40, 696, 7, "Mar 03"),
+    (76, 696, 7, "Grocery    store"),
+    (342, 696, 7, "50.00"),
+    (455, 697.5, 7, "950.00"),
+    (78, 684, 7, "FOODCO #123"),
+    (40, 640, 7, "Words 2pt apart:"),
+    (140, 640, 7, "ab"),
+    (150.4, 640, 7, "cd"),
+    (500, 100, 7, "continued"),
+]
+
+
+def make_pdf() -> bytes:
+    """A one page PDF with LINES, written by hand to avoid a PDF library."""
+    content = b"".join(
+        b"BT /F1 %g Tf %g %g Td (%s) Tj ET\n" % (size, x, y, text.encode("ascii"))
+        for x, y, size, text in LINES
+    )
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792]"
+            b" /Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>"
+        ),
+        b"<< /Length %d >>\nstream\n%sendstream" % (len(content), content),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>",
+    ]
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, xref)
+    )
+    return out.getvalue()
+
+
+class RenderLayoutTest(unittest.TestCase):
+    def setUp(self):
+        self.pdf = pdfplumber.open(io.BytesIO(make_pdf()))
+        self.page = self.pdf.pages[0]
+
+    def tearDown(self):
+        self.pdf.close()
+
+    def test_matches_pdfplumber(self):
+        for x_density in (4, 4.5, 7.25):
+            with self.subTest(x_density=x_density):
+                self.assertEqual(
+                    render_layout(self.page, x_density),
+                    self.page.extract_text(
+                        layout=True, x_density=x_density, x_tolerance=1
+                    ),
+                )
+
+    def test_matches_pdfplumber_within_bbox(self):
+        bbox = (0, 0, 0.6 * self.page.width, self.page.height)
+        self.assertEqual(
+            render_layout(self.page, 4, bbox=bbox),
+            self.page.within_bbox(bbox).extract_text(
+                layout=True, x_density=4, x_tolerance=1
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()